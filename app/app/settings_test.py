@@ -0,0 +1,11 @@
+"""
+Django settings used when running the test suite.
+
+Same as the default settings except that passwords are hashed with MD5,
+so every create_user/create_superuser in the tests skips the slow
+PBKDF2 hashing.
+"""
+
+from app.settings import *  # noqa: F401,F403
+
+PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
@@ -59,6 +59,11 @@ class Tag(models.Model):
         on_delete=models.CASCADE
     )
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', 'name']),
+        ]
+
     def __str__(self):
         return self.name
 
@@ -71,6 +76,11 @@ class Ingredient(models.Model):
         on_delete=models.CASCADE
     )
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', 'name']),
+        ]
+
     def __str__(self):
         return self.name
 
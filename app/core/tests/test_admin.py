@@ -3,29 +3,27 @@ from django.contrib.auth import get_user_model
 from django.urls import reverse
 
 
-class AdminTests(TestCase):
+User = get_user_model()
 
-    def setUp(self):
-        admin_email = 'admin@admin.com'
-        admin_password = 'adminPass'
-        user_email = 'user@user.com'
-        user_password = 'userPass'
-        user_name = 'User'
 
-        self.client = Client()
+class AdminTests(TestCase):
 
-        self.admin_user = get_user_model().objects.create_superuser(
-            email=admin_email,
-            password=admin_password,
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin_user = User.objects.create_superuser(
+            email='admin@admin.com',
+            password='adminPass',
         )
-        self.client.force_login(self.admin_user)
-
-        self.user = get_user_model().objects.create_user(
-            email=user_email,
-            password=user_password,
-            name=user_name,
+        cls.user = User.objects.create_user(
+            email='user@user.com',
+            password='userPass',
+            name='User',
         )
 
+    def setUp(self):
+        self.client = Client()
+        self.client.force_login(self.admin_user)
+
     def test_user_listed(self):
         """Test that users are listed on user page"""
         url = reverse('admin:core_user_changelist')
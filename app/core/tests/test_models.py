@@ -4,22 +4,27 @@ from django.contrib.auth import get_user_model
 from core import models
 
 
+User = get_user_model()
+
+
 def sample_user(email='user@user.com', password='userPass'):
     """Create a sample user"""
-    return get_user_model().objects.create_user(email, password)
+    return User.objects.create_user(email, password)
 
 
 class ModelTests(TestCase):
+    email = "test@test.com"
+    password = "testpass123"
 
-    def setUp(self):
-        self.email = "test@test.com"
-        self.password = "testpass123"
+    @classmethod
+    def setUpTestData(cls):
+        cls.sample_user = sample_user()
 
     def test_create_user_with_emai_succesful(self):
         """Test creating user with email is succseful"""
         test_email = "test@test.com"
         test_password = "testpass123"
-        user = get_user_model().objects.create_user(
+        user = User.objects.create_user(
             email=self.email,
             password=self.password,
         )
@@ -30,7 +35,7 @@ class ModelTests(TestCase):
     def test_new_user_email_normalized(self):
         """Test the email for a new user is normalized"""
         test_email = "test@TEST.com"
-        user = get_user_model().objects.create_user(
+        user = User.objects.create_user(
             email=test_email,
             password=self.password,
         )
@@ -42,14 +47,14 @@ class ModelTests(TestCase):
         test_email = None
 
         with self.assertRaises(ValueError):
-            get_user_model().objects.create_user(
+            User.objects.create_user(
                 email=test_email,
                 password=self.password,
             )
 
     def test_create_new_superuser(self):
         """Test creating new superuser"""
-        user = get_user_model().objects.create_superuser(
+        user = User.objects.create_superuser(
             email=self.email,
             password=self.password,
         )
@@ -60,7 +65,7 @@ class ModelTests(TestCase):
     def test_tag_str(self):
         """Test the tag as string representation"""
         tag = models.Tag.objects.create(
-            user=sample_user(),
+            user=self.sample_user,
             name='Vegan'
         )
 
@@ -69,7 +74,7 @@ class ModelTests(TestCase):
     def test_ingredient_str(self):
         """Test the ingredient string representation"""
         ingredient = models.Ingredient.objects.create(
-            user=sample_user(),
+            user=self.sample_user,
             name='Cucumber'
         )
 
@@ -78,7 +83,7 @@ class ModelTests(TestCase):
     def test_recipe_str(self):
         """Test the recipe string representation"""
         recipe = models.Recipe.objects.create(
-            user=sample_user(),
+            user=self.sample_user,
             title='Steak and mushroom sauce',
             time_minutes=5,
             price=5.0
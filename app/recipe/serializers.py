@@ -30,13 +30,24 @@ class RecipeSerializer(serializers.ModelSerializer):
         many=True,
         queryset=Tag.objects.all()
     )
+    tag_count = serializers.SerializerMethodField()
+    ingredient_count = serializers.SerializerMethodField()
 
     class Meta:
         model = Recipe
         fields = ('id', 'title', 'ingredients', 'tags',
+                  'tag_count', 'ingredient_count',
                   'time_minutes', 'price', 'link')
         read_only_fileds = ('id', )
 
+    def get_tag_count(self, obj):
+        """Count from the prefetch cache, no extra query per recipe"""
+        return len(obj.tags.all())
+
+    def get_ingredient_count(self, obj):
+        """Count from the prefetch cache, no extra query per recipe"""
+        return len(obj.ingredients.all())
+
 
 class RecipeDetailSerializer(RecipeSerializer):
     """Serialize recipe detail"""
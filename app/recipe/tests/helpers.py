@@ -0,0 +1,58 @@
+from django.contrib.auth import get_user_model
+from core.models import Recipe, Tag, Ingredient
+
+
+User = get_user_model()
+
+
+def sample_user(email='user@user.com'):
+    """Create a user without hashing a password
+
+    force_authenticate never checks credentials, so the tests skip the
+    expensive hash entirely.
+    """
+    user = User(email=email)
+    user.set_unusable_password()
+    user.save()
+
+    return user
+
+
+def sample_tag(user, name='Main Course'):
+    """Create a sample tag"""
+    return Tag.objects.create(user=user, name=name)
+
+
+def sample_ingredients(user, name='Cinnamon'):
+    """Create sample ingredient"""
+    return Ingredient.objects.create(user=user, name=name)
+
+
+def sample_recipe(user, **params):
+    """Create and return a sample recipe"""
+    defaults = {
+        'title': 'sampleRecipe',
+        'time_minutes': 10,
+        'price': 100.0
+    }
+    defaults.update(params)
+
+    return Recipe.objects.create(user=user, **defaults)
+
+
+def bulk_sample_recipes(user, specs):
+    """Create sample recipes with a single INSERT statement"""
+    defaults = {
+        'time_minutes': 10,
+        'price': 100.0
+    }
+    Recipe.objects.bulk_create([
+        Recipe(user=user, **dict(defaults, **spec)) for spec in specs
+    ])
+    recipes = Recipe.objects.filter(
+        user=user,
+        title__in=[spec['title'] for spec in specs],
+    )
+    by_title = {recipe.title: recipe for recipe in recipes}
+
+    return [by_title[spec['title']] for spec in specs]
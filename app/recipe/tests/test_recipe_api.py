@@ -1,18 +1,33 @@
 import os
 import tempfile
-from PIL import Image
 from django.contrib.auth import get_user_model
 from django.urls import reverse
-from django.test import TestCase
+from django.test import TestCase, SimpleTestCase
 from rest_framework import status
 from rest_framework.test import APIClient
-from core.models import Recipe, Tag, Ingredient
+from core.models import Recipe
 from recipe.serializers import RecipeSerializer, RecipeDetailSerializer
+from recipe.tests.helpers import (
+    sample_user, sample_tag, sample_ingredients, sample_recipe,
+    bulk_sample_recipes,
+)
+
+
+User = get_user_model()
 
 
 RECIPES_URL = reverse('recipe:recipe-list')
 
 
+# Smallest valid upload payload: a 1x1 greyscale PNG, so the tests do
+# not need PIL at all
+TINY_PNG = (
+    b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00'
+    b'\x01\x08\x00\x00\x00\x00:~\x9bU\x00\x00\x00\nIDATx\x9cc`\x00\x00'
+    b'\x00\x02\x00\x01H\xaf\xa4q\x00\x00\x00\x00IEND\xaeB`\x82'
+)
+
+
 def image_upload_url(recipe_id):
     """Return URL for recipe image upload"""
     return reverse('recipe:recipe-upload-image', args=[recipe_id])
@@ -23,29 +38,7 @@ def detail_url(recipe_id):
     return reverse('recipe:recipe-detail', args=[recipe_id])
 
 
-def sample_tag(user, name='Main Course'):
-    """Create a sample tag"""
-    return Tag.objects.create(user=user, name=name)
-
-
-def sample_ingredients(user, name='Cinnamon'):
-    """Create sample ingredient"""
-    return Ingredient.objects.create(user=user, name=name)
-
-
-def sample_recipe(user, **params):
-    """Create and return a sample recipe"""
-    defaults = {
-        'title': 'sampleRecipe',
-        'time_minutes': 10,
-        'price': 100.0
-    }
-    defaults.update(params)
-
-    return Recipe.objects.create(user=user, **defaults)
-
-
-class PublicRecipeApiTests(TestCase):
+class PublicRecipeApiTests(SimpleTestCase):
     """Test unauth recipe API access"""
 
     def setUp(self):
@@ -61,28 +54,31 @@ class PublicRecipeApiTests(TestCase):
 class PrivetRecipeApiTests(TestCase):
     """Test unauth recipe API access"""
 
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = sample_user()
+
     def setUp(self):
         self.client = APIClient()
-        self.user = get_user_model().objects.create_user(
-            email='user@user.com',
-            password='userPass'
-        )
         self.client.force_authenticate(self.user)
 
     def test_retrieve_recipes(self):
         """Test retrieving a list of recipes"""
         sample_recipe(user=self.user)
         sample_recipe(user=self.user)
-        res = self.client.get(RECIPES_URL)
+
+        # pagination count, recipes, prefetched tags and ingredients
+        with self.assertNumQueries(4):
+            res = self.client.get(RECIPES_URL)
         recipes = Recipe.objects.all().order_by('-id')
         serializer = RecipeSerializer(recipes, many=True)
 
         self.assertEqual(res.status_code, status.HTTP_200_OK)
-        self.assertEqual(res.data, serializer.data)
+        self.assertEqual(res.data['results'], serializer.data)
 
     def test_recipes_limited_to_user(self):
         """Test retrieving a recipes for user"""
-        user2 = get_user_model().objects.create_user(
+        user2 = User.objects.create_user(
             email='user2@user2.com',
             password='user2Pass'
         )
@@ -93,8 +89,8 @@ class PrivetRecipeApiTests(TestCase):
         serializer = RecipeSerializer(recipes, many=True)
 
         self.assertEqual(res.status_code, status.HTTP_200_OK)
-        self.assertEqual(res.data, serializer.data)
-        self.assertEqual(len(res.data), 1)
+        self.assertEqual(res.data['results'], serializer.data)
+        self.assertEqual(len(res.data['results']), 1)
 
     def test_view_recipe_detail(self):
         """Test viewing recipe detail"""
@@ -102,7 +98,11 @@ class PrivetRecipeApiTests(TestCase):
         recipe.tags.add(sample_tag(user=self.user))
         recipe.ingredients.add(sample_ingredients(user=self.user))
         url = detail_url(recipe.id)
-        res = self.client.get(url)
+
+        # recipe, prefetched tags and ingredients
+        with self.assertNumQueries(3):
+            res = self.client.get(url)
+
         serializer = RecipeDetailSerializer(recipe)
 
         self.assertEqual(res.data, serializer.data)
@@ -118,10 +118,12 @@ class PrivetRecipeApiTests(TestCase):
 
         self.assertEqual(res.status_code, status.HTTP_201_CREATED)
 
-        recipe = Recipe.objects.get(id=res.data['id'])
+        recipe_vals = Recipe.objects.values(
+            *payload.keys()
+        ).get(id=res.data['id'])
+        recipe_vals['price'] = float(recipe_vals['price'])
 
-        for key in payload.keys():
-            self.assertEqual(payload[key], getattr(recipe, key))
+        self.assertEqual(recipe_vals, payload)
 
     def test_create_recipe_with_tags(self):
         """Create recipe with tags"""
@@ -138,9 +140,9 @@ class PrivetRecipeApiTests(TestCase):
         self.assertEqual(res.status_code, status.HTTP_201_CREATED)
 
         recipe = Recipe.objects.get(id=res.data['id'])
-        tags = recipe.tags.all()
+        tags = list(recipe.tags.all())
 
-        self.assertEqual(tags.count(), 2)
+        self.assertEqual(len(tags), 2)
         self.assertIn(tag1, tags)
         self.assertIn(tag2, tags)
 
@@ -159,9 +161,9 @@ class PrivetRecipeApiTests(TestCase):
         self.assertEqual(res.status_code, status.HTTP_201_CREATED)
 
         recipe = Recipe.objects.get(id=res.data['id'])
-        ingredients = recipe.ingredients.all()
+        ingredients = list(recipe.ingredients.all())
 
-        self.assertEqual(ingredients.count(), 2)
+        self.assertEqual(len(ingredients), 2)
         self.assertIn(ingredient1, ingredients)
         self.assertIn(ingredient2, ingredients)
 
@@ -209,12 +211,12 @@ class PrivetRecipeApiTests(TestCase):
 
 class RecipeImageUploadTests(TestCase):
 
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = sample_user()
+
     def setUp(self):
         self.client = APIClient()
-        self.user = get_user_model().objects.create_user(
-            email='user@user.com',
-            password='userPass'
-        )
         self.client.force_authenticate(self.user)
         self.recipe = sample_recipe(user=self.user)
 
@@ -224,9 +226,8 @@ class RecipeImageUploadTests(TestCase):
     def test_upload_image_to_recipe(self):
         """Test uploading an image to recipe"""
         url = image_upload_url(self.recipe.id)
-        with tempfile.NamedTemporaryFile(suffix='.jpg') as ntf:
-            img = Image.new('RGB', (10, 10))
-            img.save(ntf, format='JPEG')
+        with tempfile.NamedTemporaryFile(suffix='.png') as ntf:
+            ntf.write(TINY_PNG)
             ntf.seek(0)
             res = self.client.post(url, {'image': ntf}, format='multipart')
         self.recipe.refresh_from_db()
@@ -244,9 +245,11 @@ class RecipeImageUploadTests(TestCase):
 
     def test_filter_recipes_by_tags(self):
         """Test return recipe by tag"""
-        recepi1 = sample_recipe(user=self.user, title='Thai breakfast')
-        recepi2 = sample_recipe(user=self.user, title='Thai dessert')
-        recepi3 = sample_recipe(user=self.user, title='Fish and Chips')
+        recepi1, recepi2, recepi3 = bulk_sample_recipes(self.user, [
+            {'title': 'Thai breakfast'},
+            {'title': 'Thai dessert'},
+            {'title': 'Fish and Chips'},
+        ])
         tag1 = sample_tag(user=self.user, name='Breakfast')
         tag2 = sample_tag(user=self.user, name='Dessert')
         recepi1.tags.add(tag1)
@@ -259,15 +262,33 @@ class RecipeImageUploadTests(TestCase):
         serializer2 = RecipeSerializer(recepi2)
         serializer3 = RecipeSerializer(recepi3)
 
-        self.assertIn(serializer1.data, res.data)
-        self.assertIn(serializer2.data, res.data)
-        self.assertNotIn(serializer3.data, res.data)
+        self.assertIn(serializer1.data, res.data['results'])
+        self.assertIn(serializer2.data, res.data['results'])
+        self.assertNotIn(serializer3.data, res.data['results'])
+
+    def test_filter_recipes_counts_not_filtered(self):
+        """Test counts cover all relations when filtering by one of them"""
+        tag1 = sample_tag(user=self.user, name='Breakfast')
+        tag2 = sample_tag(user=self.user, name='Vegan')
+        ingredient1 = sample_ingredients(user=self.user, name='Eggs')
+        ingredient2 = sample_ingredients(user=self.user, name='Milk')
+        self.recipe.tags.add(tag1, tag2)
+        self.recipe.ingredients.add(ingredient1, ingredient2)
+        res = self.client.get(
+            RECIPES_URL,
+            {'tags': f'{tag1.id}', 'ingredients': f'{ingredient1.id}'}
+        )
+
+        self.assertEqual(res.data['results'][0]['tag_count'], 2)
+        self.assertEqual(res.data['results'][0]['ingredient_count'], 2)
 
     def test_filter_recipes_by_ingredient(self):
         """Test return recipe by ingredient"""
-        recepi1 = sample_recipe(user=self.user, title='Thai breakfast')
-        recepi2 = sample_recipe(user=self.user, title='Thai dessert')
-        recepi3 = sample_recipe(user=self.user, title='Fish and Chips')
+        recepi1, recepi2, recepi3 = bulk_sample_recipes(self.user, [
+            {'title': 'Thai breakfast'},
+            {'title': 'Thai dessert'},
+            {'title': 'Fish and Chips'},
+        ])
         ingredient1 = sample_ingredients(user=self.user, name='Potatos')
         ingredient2 = sample_ingredients(user=self.user, name='Chocolate')
         recepi1.ingredients.add(ingredient1)
@@ -280,6 +301,6 @@ class RecipeImageUploadTests(TestCase):
         serializer2 = RecipeSerializer(recepi2)
         serializer3 = RecipeSerializer(recepi3)
 
-        self.assertIn(serializer1.data, res.data)
-        self.assertIn(serializer2.data, res.data)
-        self.assertNotIn(serializer3.data, res.data)
+        self.assertIn(serializer1.data, res.data['results'])
+        self.assertIn(serializer2.data, res.data['results'])
+        self.assertNotIn(serializer3.data, res.data['results'])
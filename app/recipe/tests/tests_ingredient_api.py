@@ -1,16 +1,19 @@
 from django.contrib.auth import get_user_model
 from django.urls import reverse
-from django.test import TestCase
+from django.test import TestCase, SimpleTestCase
 from rest_framework import status
 from rest_framework.test import APIClient
 from core.models import Ingredient, Recipe
 from recipe.serializers import IngredientSerializer
 
 
+User = get_user_model()
+
+
 INGREDIENTS_URL = reverse('recipe:ingredient-list')
 
 
-class PublicIngredientsApiTests(TestCase):
+class PublicIngredientsApiTests(SimpleTestCase):
     """Test the publicly available ingredients API"""
 
     def setUp(self):
@@ -28,7 +31,7 @@ class PrivetIngredientsApiTests(TestCase):
 
     def setUp(self):
         self.client = APIClient()
-        self.user = get_user_model().objects.create_user(
+        self.user = User.objects.create_user(
             email='user@user.com',
             password='userPass'
         )
@@ -43,11 +46,11 @@ class PrivetIngredientsApiTests(TestCase):
         serializer = IngredientSerializer(ingredients, many=True)
 
         self.assertEqual(res.status_code, status.HTTP_200_OK)
-        self.assertEqual(res.data, serializer.data)
+        self.assertEqual(res.data['results'], serializer.data)
 
     def ingredients_limited_to_user(self):
         """Test that ingredients for the authorized user are returned"""
-        user2 = get_user_model().objects.create_user(
+        user2 = User.objects.create_user(
             email='user2@user2.com',
             password='user2Pass'
         )
@@ -56,8 +59,8 @@ class PrivetIngredientsApiTests(TestCase):
         res = self.client.get(INGREDIENTS_URL)
 
         self.assertEqual(res.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(res.data), 1)
-        self.assertEqual(res.date[0]['name'], ingredient.name)
+        self.assertEqual(len(res.data['results']), 1)
+        self.assertEqual(res.data['results'][0]['name'], ingredient.name)
 
     def test_create_ingredient_successful(self):
         """Tet create a new ingredient successful"""
@@ -92,8 +95,8 @@ class PrivetIngredientsApiTests(TestCase):
         serializer1 = IngredientSerializer(ingredient1)
         serializer2 = IngredientSerializer(ingredient2)
 
-        self.assertIn(serializer1.data, res.data)
-        self.assertNotIn(serializer2.data, res.data)
+        self.assertIn(serializer1.data, res.data['results'])
+        self.assertNotIn(serializer2.data, res.data['results'])
 
     def test_rtest_retrieve_ingredients_assigned_unique(self):
         """Test filtering ingredients by assigned returns unique items"""
@@ -115,4 +118,4 @@ class PrivetIngredientsApiTests(TestCase):
         recipe2.ingredients.add(ingredient)
         res = self.client.get(INGREDIENTS_URL, {'assigned_only': 1})
 
-        self.assertEqual(len(res.data), 1)
+        self.assertEqual(len(res.data['results']), 1)
@@ -1,16 +1,19 @@
 from django.contrib.auth import get_user_model
 from django.urls import reverse
-from django.test import TestCase
+from django.test import TestCase, SimpleTestCase
 from rest_framework import status
 from rest_framework.test import APIClient
 from core.models import Tag, Recipe
 from recipe.serializers import TagSerializer
 
 
+User = get_user_model()
+
+
 TAGS_URL = reverse('recipe:tag-list')
 
 
-class PublicTagsApiTests(TestCase):
+class PublicTagsApiTests(SimpleTestCase):
     """Test the publicly available tags API """
 
     def setUp(self):
@@ -27,7 +30,7 @@ class PrivetTagsApiTests(TestCase):
     """Test the autorized user tags API"""
 
     def setUp(self):
-        self.user = get_user_model().objects.create_user(
+        self.user = User.objects.create_user(
             email='user@user.com',
             password='userPass',
         )
@@ -43,11 +46,11 @@ class PrivetTagsApiTests(TestCase):
         serializer = TagSerializer(tags, many=True)
 
         self.assertEqual(res.status_code, status.HTTP_200_OK)
-        self.assertEqual(res.data, serializer.data)
+        self.assertEqual(res.data['results'], serializer.data)
 
     def test_tags_limited_to_user(self):
         """Test that tags returned are for auth user"""
-        user2 = get_user_model().objects.create_user(
+        user2 = User.objects.create_user(
             email='user2@user2.com',
             password='user2Pass'
         )
@@ -56,8 +59,8 @@ class PrivetTagsApiTests(TestCase):
         res = self.client.get(TAGS_URL)
 
         self.assertEqual(res.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(res.data), 1)
-        self.assertEqual(res.data[0]['name'], tag.name)
+        self.assertEqual(len(res.data['results']), 1)
+        self.assertEqual(res.data['results'][0]['name'], tag.name)
 
     def test_create_tag_successful(self):
         """Test creating a new tag"""
@@ -92,8 +95,8 @@ class PrivetTagsApiTests(TestCase):
         serializer1 = TagSerializer(tag1)
         serializer2 = TagSerializer(tag2)
 
-        self.assertIn(serializer1.data, res.data)
-        self.assertNotIn(serializer2.data, res.data)
+        self.assertIn(serializer1.data, res.data['results'])
+        self.assertNotIn(serializer2.data, res.data['results'])
 
     def test_retrieve_tags_assigned_unique(self):
         """Test filtering tags by assigned returns unique items"""
@@ -115,4 +118,4 @@ class PrivetTagsApiTests(TestCase):
         recipe2.tags.add(tag)
         res = self.client.get(TAGS_URL, {'assigned_only': 1})
 
-        self.assertEqual(len(res.data), 1)
+        self.assertEqual(len(res.data['results']), 1)
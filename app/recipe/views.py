@@ -2,11 +2,17 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework import viewsets, mixins, status
 from rest_framework.authentication import TokenAuthentication
+from rest_framework.pagination import PageNumberPagination
 from rest_framework.permissions import IsAuthenticated
 from core.models import Recipe, Tag, Ingredient
 from recipe import serializers
 
 
+class DefaultPagination(PageNumberPagination):
+    """Bound list responses to a fixed page size"""
+    page_size = 25
+
+
 class BaseRecipeAttributesViewSet(
     viewsets.GenericViewSet,
     mixins.ListModelMixin,
@@ -15,6 +21,7 @@ class BaseRecipeAttributesViewSet(
     """Manage recipe attr in the database"""
     authentication_classes = (TokenAuthentication, )
     permission_classes = (IsAuthenticated, )
+    pagination_class = DefaultPagination
 
     def get_queryset(self):
         """Return object for the current auth user only"""
@@ -26,8 +33,8 @@ class BaseRecipeAttributesViewSet(
         if assigned_only:
             queryset = queryset.filter(recipe__isnull=False)
 
-        return queryset.filter(
-            user=self.request.user
+        return queryset.select_related('user').filter(
+            user_id=self.request.user.pk
         ).order_by('-name').distinct()
 
     def perform_create(self, serializer):
@@ -53,6 +60,7 @@ class RecipeViewSet(viewsets.ModelViewSet):
     queryset = Recipe.objects.all()
     authentication_classes = (TokenAuthentication, )
     permission_classes = (IsAuthenticated, )
+    pagination_class = DefaultPagination
 
     def _params_to_ints(self, qs):
         """Convert a list of srting IDs to a list of integers"""
@@ -69,8 +77,12 @@ class RecipeViewSet(viewsets.ModelViewSet):
         if ingredients:
             ingredient_ids = self._params_to_ints(ingredients)
             queryset = queryset.filter(ingredients__id__in=ingredient_ids)
+        if self.action == 'list':
+            queryset = queryset.defer('image')
 
-        return queryset.filter(user=self.request.user)
+        return queryset.select_related('user').filter(
+            user_id=self.request.user.pk
+        ).prefetch_related('tags', 'ingredients').order_by('-id')
 
     def get_serializer_class(self):
         """Return appropriate serializer class"""